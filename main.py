@@ -1,58 +1,61 @@
 import logging
-import yaml
+import queue
+import signal
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from src.config_loader import load_config
 from src.strategy import TradingStrategy
-from src.data_feed import DataFeed
-import time
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('trading_bot.log'),
-        logging.StreamHandler()
-    ]
-)
+from src.data_feed import MultiAssetDataFeed
+
+# Configure logging: producers only enqueue records; the file and stream
+# writes happen on the listener thread, off the WebSocket hot path
+log_queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+sink_handlers = [logging.FileHandler('trading_bot.log'), logging.StreamHandler()]
+for handler in sink_handlers:
+    handler.setFormatter(formatter)
+log_listener = QueueListener(log_queue, *sink_handlers)
+log_listener.start()
 
 logger = logging.getLogger(__name__)
 
 def main():
-    # Load config
-    with open('config/config.yaml', 'r') as file:
-        config = yaml.safe_load(file)
-    
-    config_path = 'config/config.yaml'
-    
-    # Initialize strategies and data feeds for each asset
+    # Load config once; the parsed dict is shared by every strategy and client
+    config = load_config('config/config.yaml')
+
+    # Initialize a strategy per asset; they all share one multiplexed feed
     strategies = {}
-    data_feeds = {}
-    
+    callbacks = {}
+
     logger.info("Starting multi-asset trading bot...")
-    
-    # Create strategy and data feed for each enabled asset
+
+    # Create a strategy for each enabled asset
     for asset in config['assets']:
         if asset['enabled']:
             symbol = asset['symbol']
             logger.info(f"Initializing strategy for {symbol}...")
-            
+
             # Create strategy instance for this asset
-            strategies[symbol] = TradingStrategy(config_path, symbol)
-            
-            # Create data feed for this asset
-            logger.info(f"Starting data feed for {symbol}...")
-            data_feeds[symbol] = DataFeed(symbol, strategies[symbol].on_new_data)
-            data_feeds[symbol].start()
-    
-    # Keep the main thread running
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Shutting down bot...")
-        # Stop all data feeds
-        for symbol, feed in data_feeds.items():
-            logger.info(f"Stopping data feed for {symbol}...")
-            feed.stop()
+            strategies[symbol] = TradingStrategy(config, symbol)
+            callbacks[symbol] = strategies[symbol].on_new_data
+
+    # One WebSocket connection carries the kline stream for every symbol
+    logger.info(f"Starting data feed for {', '.join(callbacks)}...")
+    data_feed = MultiAssetDataFeed(list(callbacks), callbacks)
+    data_feed.start()
+
+    # Park the main thread until interrupted — no periodic wakeups
+    shutdown = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: shutdown.set())
+    signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+    shutdown.wait()
+
+    logger.info("Shutting down bot...")
+    logger.info("Stopping data feed...")
+    data_feed.stop()
+    log_listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,7 +9,9 @@ setup(
         'websocket-client>=1.7.0',
         'pandas>=2.2.0',
         'numpy>=1.26.4',
+        'numba>=0.59.0',
         'pyyaml>=6.0.1',
+        'orjson>=3.9.12',
         'python-dotenv>=1.0.1',
         'matplotlib>=3.8.2'
     ],
@@ -1,16 +1,17 @@
-from pybit.unified_trading import HTTP
 from typing import Dict
-import yaml
 import logging
+from .config_loader import load_config
+from .http_singleton import get_http
 
 logger = logging.getLogger(__name__)
 
 class BybitClient:
-    def __init__(self, config_path: str):
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        
-        self.client = HTTP(
+    def __init__(self, config):
+        """config is an already-parsed config dict or a path to the YAML file"""
+        if isinstance(config, str):
+            config = load_config(config)
+
+        self.client = get_http(
             testnet=config['bybit']['testnet'],
             api_key=config['bybit']['api_key'],
             api_secret=config['bybit']['api_secret']
@@ -0,0 +1,23 @@
+import functools
+import os
+import yaml
+
+try:
+    # libyaml C bindings parse roughly an order of magnitude faster
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(abs_path: str, mtime: float) -> dict:
+    # mtime participates in the cache key only: an edited file re-parses,
+    # an untouched one is served from cache
+    with open(abs_path, 'r') as file:
+        return yaml.load(file, Loader=_Loader)
+
+
+def load_config(path: str) -> dict:
+    """Parse a YAML config file, caching per absolute path and mtime"""
+    abs_path = os.path.abspath(path)
+    return _load_config(abs_path, os.path.getmtime(abs_path))
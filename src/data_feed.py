@@ -1,65 +1,190 @@
 import websocket
 import json
+try:
+    # Rust JSON parser, several times faster than the stdlib on the WS hot path
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+import sys
 import threading
 import time
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+import numpy as np
 import pandas as pd
 import logging
-from datetime import datetime
-from pybit.unified_trading import HTTP
+from .http_singleton import get_http
 
 logger = logging.getLogger(__name__)
 
-class DataFeed:
-    def __init__(self, symbol: str, strategy_callback: Callable):
-        self.symbol = symbol
-        self.strategy_callback = strategy_callback
+# Number of candles kept for analysis
+BUFFER_SIZE = 100
+
+
+class KlineBuffer:
+    """Preallocated struct-of-arrays ring buffer for one symbol's candles
+
+    One typed array per column instead of a list of dicts, so each tick
+    writes a handful of scalars instead of allocating objects.
+    """
+
+    def __init__(self):
+        self._ring = {
+            'ts': np.empty(BUFFER_SIZE, dtype='int64'),
+            'open': np.empty(BUFFER_SIZE, dtype='float64'),
+            'high': np.empty(BUFFER_SIZE, dtype='float64'),
+            'low': np.empty(BUFFER_SIZE, dtype='float64'),
+            'close': np.empty(BUFFER_SIZE, dtype='float64'),
+            'volume': np.empty(BUFFER_SIZE, dtype='float64')
+        }
+        self._head = 0   # next slot to write
+        self.count = 0   # number of valid candles in the ring
+        self.last_dispatch_ts = -1  # last candle timestamp sent to the strategy
+
+    def last_ts(self) -> int:
+        """Timestamp of the most recent candle, or -1 when empty"""
+        if self.count == 0:
+            return -1
+        return self._ring['ts'][(self._head - 1) % BUFFER_SIZE]
+
+    def append(self, ts: int, open_: float, high: float, low: float,
+               close: float, volume: float):
+        """Write one candle into the ring, evicting the oldest slot"""
+        head = self._head
+        ring = self._ring
+        ring['ts'][head] = ts
+        ring['open'][head] = open_
+        ring['high'][head] = high
+        ring['low'][head] = low
+        ring['close'][head] = close
+        ring['volume'][head] = volume
+        self._head = (head + 1) % BUFFER_SIZE
+        if self.count < BUFFER_SIZE:
+            self.count += 1
+
+    def extend(self, ts: np.ndarray, open_: np.ndarray, high: np.ndarray,
+               low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        """Bulk-append chronological candle arrays with sliced copies"""
+        n = len(ts)
+        cols = (('ts', ts), ('open', open_), ('high', high),
+                ('low', low), ('close', close), ('volume', volume))
+        if n >= BUFFER_SIZE:
+            for name, values in cols:
+                self._ring[name][:] = values[-BUFFER_SIZE:]
+            self._head = 0
+            self.count = BUFFER_SIZE
+            return
+        head = self._head
+        first = min(n, BUFFER_SIZE - head)
+        for name, values in cols:
+            self._ring[name][head:head + first] = values[:first]
+            if n > first:
+                self._ring[name][:n - first] = values[first:]
+        self._head = (head + n) % BUFFER_SIZE
+        self.count = min(self.count + n, BUFFER_SIZE)
+
+    def update_last(self, ts: int, open_: float, high: float, low: float,
+                    close: float, volume: float):
+        """Overwrite the most recent slot with an intra-candle update"""
+        last = (self._head - 1) % BUFFER_SIZE
+        ring = self._ring
+        ring['ts'][last] = ts
+        ring['open'][last] = open_
+        ring['high'][last] = high
+        ring['low'][last] = low
+        ring['close'][last] = close
+        ring['volume'][last] = volume
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build a DataFrame over the ring buffer, oldest candle first"""
+        if self.count < BUFFER_SIZE:
+            # Ring has not wrapped yet: valid data is the leading slice
+            ordered = {k: v[:self.count] for k, v in self._ring.items()}
+        else:
+            # Ring is full: head points at the oldest candle
+            ordered = {k: np.roll(v, -self._head) for k, v in self._ring.items()}
+        ts = ordered.pop('ts')
+        df = pd.DataFrame(ordered, copy=False)
+        # Reinterpret the int64 milliseconds directly as datetime64[ms] — a
+        # C-level cast instead of a trip through the pandas datetime parser
+        df.index = pd.DatetimeIndex(ts.view('datetime64[ms]'))
+        df.index.name = 'datetime'
+        return df
+
+
+class MultiAssetDataFeed:
+    """One multiplexed WebSocket feeding any number of symbols
+
+    Bybit's v5 public stream accepts many kline topics on a single
+    connection, so N assets share one TLS session, one thread and one
+    reconnect loop instead of N of each.
+    """
+
+    def __init__(self, symbols: List[str], callbacks: Dict[str, Callable]):
+        self.symbols = list(symbols)
+        self.callbacks = dict(callbacks)
         self.ws = None
-        self.data_buffer = []
         self.is_running = True
         self.reconnect_delay = 5
         self.max_reconnect_delay = 300
         self.ws_lock = threading.Lock()
-        self.session = HTTP(testnet=True)
-        logger.info(f"[{symbol}] DataFeed initialized")
-        
+        self.session = get_http(testnet=True)
+        self._buffers = {symbol: KlineBuffer() for symbol in self.symbols}
+        # Interned so the per-message topic lookup hits the pointer-equality
+        # fast path instead of formatting a fresh string every tick
+        self._topic_map = {sys.intern(f'kline.15m.{symbol}'): symbol
+                           for symbol in self.symbols}
+        # Strategy updates run on a shared pool so indicator math doesn't
+        # block the WebSocket receive thread; a per-symbol lock keeps each
+        # symbol's updates ordered
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(8, max(1, len(self.symbols))),
+            thread_name_prefix='strategy'
+        )
+        self._strategy_locks = {symbol: threading.Lock() for symbol in self.symbols}
+        logger.info(f"[{','.join(self.symbols)}] DataFeed initialized")
+
+    def _dispatch(self, symbol: str, df: pd.DataFrame):
+        """Run one symbol's strategy update off the WebSocket thread"""
+        with self._strategy_locks[symbol]:
+            try:
+                self.callbacks[symbol](df)
+            except Exception as e:
+                logger.error(f"[{symbol}] Strategy callback error: {e}")
+
     def fetch_historical_data(self):
-        """Fetch historical kline data"""
-        try:
-            logger.info(f"[{self.symbol}] Fetching historical kline data...")
-            
-            # Get last 50 candles (more than we need, just to be safe)
-            response = self.session.get_kline(
-                category="linear",
-                symbol=self.symbol,
-                interval=15,
-                limit=50
-            )
-            
-            if 'result' in response and 'list' in response['result']:
-                # Bybit returns newest first, so reverse to get chronological order
-                candles = reversed(response['result']['list'])
-                
-                for candle in candles:
-                    self.data_buffer.append({
-                        'datetime': pd.to_datetime(int(candle[0]), unit='ms'),
-                        'open': float(candle[1]),
-                        'high': float(candle[2]),
-                        'low': float(candle[3]),
-                        'close': float(candle[4]),
-                        'volume': float(candle[5])
-                    })
-                
-                logger.info(f"[{self.symbol}] Successfully loaded {len(self.data_buffer)} historical candles")
-                
-                # Initial analysis with historical data
-                df = pd.DataFrame(self.data_buffer)
-                df.set_index('datetime', inplace=True)
-                self.strategy_callback(df)
-            
-        except Exception as e:
-            logger.error(f"[{self.symbol}] Error fetching historical data: {e}")
-    
+        """Fetch historical kline data for every symbol"""
+        for symbol in self.symbols:
+            try:
+                logger.info(f"[{symbol}] Fetching historical kline data...")
+
+                # Get last 50 candles (more than we need, just to be safe)
+                response = self.session.get_kline(
+                    category="linear",
+                    symbol=symbol,
+                    interval=15,
+                    limit=50
+                )
+
+                if 'result' in response and 'list' in response['result']:
+                    # Parse all candles in one shot: one string->float64 array
+                    # conversion instead of per-row float() and dict building.
+                    # Bybit returns newest first, so reverse to get chronological order
+                    arr = np.asarray(response['result']['list'], dtype='float64')[::-1]
+
+                    buf = self._buffers[symbol]
+                    if len(arr):
+                        buf.extend(arr[:, 0].astype('int64'), arr[:, 1],
+                                   arr[:, 2], arr[:, 3], arr[:, 4], arr[:, 5])
+
+                    logger.info(f"[{symbol}] Successfully loaded {buf.count} historical candles")
+
+                    # Initial analysis with historical data
+                    self.callbacks[symbol](buf.to_dataframe())
+
+            except Exception as e:
+                logger.error(f"[{symbol}] Error fetching historical data: {e}")
+
     def start(self):
         """Start the WebSocket connection"""
         self.is_running = True
@@ -67,7 +192,7 @@ class DataFeed:
         self.fetch_historical_data()
         # Then connect to WebSocket for real-time updates
         self._connect()
-        
+
     def stop(self):
         """Stop the WebSocket connection"""
         self.is_running = False
@@ -75,17 +200,18 @@ class DataFeed:
             if self.ws:
                 self.ws.close()
                 self.ws = None
-            
+        self._executor.shutdown(wait=True)
+
     def _connect(self):
         """Establish WebSocket connection with retry mechanism"""
         with self.ws_lock:
             if self.ws:
-                logger.info(f"[{self.symbol}] Closing existing WebSocket connection")
+                logger.info("Closing existing WebSocket connection")
                 self.ws.close()
                 self.ws = None
-            
+
             ws_url = "wss://stream-testnet.bybit.com/v5/public/linear"
-            
+
             # Configure WebSocket
             self.ws = websocket.WebSocketApp(
                 ws_url,
@@ -94,12 +220,12 @@ class DataFeed:
                 on_close=self._on_close,
                 on_open=self._on_open
             )
-        
+
         # Start WebSocket connection in a separate thread
         wst = threading.Thread(target=self._run_websocket)
         wst.daemon = True
         wst.start()
-    
+
     def _run_websocket(self):
         """Run WebSocket with automatic reconnection"""
         while self.is_running:
@@ -107,69 +233,83 @@ class DataFeed:
                 with self.ws_lock:
                     if self.ws:
                         self.ws.run_forever()
-                
+
                 if self.is_running:
-                    logger.info(f"[{self.symbol}] WebSocket disconnected. Reconnecting in {self.reconnect_delay} seconds...")
+                    logger.info(f"WebSocket disconnected. Reconnecting in {self.reconnect_delay} seconds...")
                     time.sleep(self.reconnect_delay)
                     # Implement exponential backoff
                     self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
                     self._connect()
             except Exception as e:
-                logger.error(f"[{self.symbol}] WebSocket run error: {e}")
+                logger.error(f"WebSocket run error: {e}")
                 time.sleep(self.reconnect_delay)
-    
+
     def _on_message(self, ws, message):
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(message)
-            if 'topic' in data and data['topic'] == f'kline.15m.{self.symbol}':
+            data = json_loads(message)
+            symbol = self._topic_map.get(data.get('topic'))
+            if symbol is not None:
                 kline = data['data']
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                logger.info(f"[{self.symbol}] Received new kline data at {current_time}")
-                logger.info(f"[{self.symbol}] Candle: Open: ${float(kline['open']):,.2f}, Close: ${float(kline['close']):,.2f}, " +
-                           f"High: ${float(kline['high']):,.2f}, Low: ${float(kline['low']):,.2f}")
-                
-                self.data_buffer.append({
-                    'datetime': pd.to_datetime(kline['timestamp'], unit='ms'),
-                    'open': float(kline['open']),
-                    'high': float(kline['high']),
-                    'low': float(kline['low']),
-                    'close': float(kline['close']),
-                    'volume': float(kline['volume'])
-                })
-                
-                # Keep last 100 candles for analysis
-                if len(self.data_buffer) > 100:
-                    self.data_buffer.pop(0)
-                
-                logger.info(f"[{self.symbol}] Current buffer size: {len(self.data_buffer)} candles")
-                
-                # Convert to DataFrame and pass to strategy
-                df = pd.DataFrame(self.data_buffer)
-                df.set_index('datetime', inplace=True)
-                self.strategy_callback(df)
-                
+                # Per-tick candle detail is debug-only so production runs
+                # skip the float parsing and formatting entirely
+                if logger.isEnabledFor(logging.DEBUG):
+                    # %(asctime)s on the handler already stamps the record
+                    logger.debug(f"[{symbol}] Received new kline data")
+                    logger.debug(f"[{symbol}] Candle: Open: ${float(kline['open']):,.2f}, Close: ${float(kline['close']):,.2f}, " +
+                                 f"High: ${float(kline['high']):,.2f}, Low: ${float(kline['low']):,.2f}")
+
+                buf = self._buffers[symbol]
+                ts = int(kline['timestamp'])
+
+                # Bybit pushes several updates while a candle is still open;
+                # mutate the last slot in place and only append on a new candle
+                candle = (ts, float(kline['open']), float(kline['high']),
+                          float(kline['low']), float(kline['close']),
+                          float(kline['volume']))
+                if ts == buf.last_ts():
+                    buf.update_last(*candle)
+                else:
+                    buf.append(*candle)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[{symbol}] Current buffer size: {buf.count} candles")
+
+                # Only run the strategy on confirmed candle closes, and only
+                # once per closed candle
+                if kline.get('confirm', True) and ts != buf.last_dispatch_ts:
+                    buf.last_dispatch_ts = ts
+                    self._executor.submit(self._dispatch, symbol, buf.to_dataframe())
+
                 # Reset reconnect delay on successful message
                 self.reconnect_delay = 5
-                
+
         except Exception as e:
-            logger.error(f"[{self.symbol}] Error processing message: {e}")
-    
+            logger.error(f"Error processing message: {e}")
+
     def _on_error(self, ws, error):
         """Handle WebSocket errors"""
-        logger.error(f"[{self.symbol}] WebSocket error: {error}")
-    
+        logger.error(f"WebSocket error: {error}")
+
     def _on_close(self, ws, close_status_code, close_msg):
         """Handle WebSocket connection close"""
-        logger.info(f"[{self.symbol}] WebSocket connection closed. Status code: {close_status_code}, Message: {close_msg}")
-    
+        logger.info(f"WebSocket connection closed. Status code: {close_status_code}, Message: {close_msg}")
+
     def _on_open(self, ws):
         """Handle WebSocket connection open"""
-        logger.info(f"[{self.symbol}] WebSocket connection opened")
-        # Subscribe to kline data
+        logger.info("WebSocket connection opened")
+        # Subscribe to kline data for every symbol on the one connection
         subscribe_message = {
             "op": "subscribe",
-            "args": [f"kline.15m.{self.symbol}"]
+            "args": list(self._topic_map)
         }
         ws.send(json.dumps(subscribe_message))
-        logger.info(f"[{self.symbol}] Subscribed to kline data")
\ No newline at end of file
+        logger.info(f"Subscribed to kline data for {', '.join(self.symbols)}")
+
+
+class DataFeed(MultiAssetDataFeed):
+    """Single-symbol feed, kept as a thin wrapper over the multiplexed one"""
+
+    def __init__(self, symbol: str, strategy_callback: Callable):
+        super().__init__([symbol], {symbol: strategy_callback})
+        self.symbol = symbol
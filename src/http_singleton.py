@@ -0,0 +1,13 @@
+import functools
+from pybit.unified_trading import HTTP
+
+
+@functools.lru_cache(maxsize=4)
+def get_http(testnet: bool = True, api_key: str = '', api_secret: str = '') -> HTTP:
+    """Return a shared pybit HTTP client for the given credentials
+
+    Every BybitClient and DataFeed used to construct its own HTTP client,
+    each with its own urllib3 connection pool — 2N TLS sessions for N
+    assets. Caching on (testnet, key, secret) reuses one kept-alive pool.
+    """
+    return HTTP(testnet=testnet, api_key=api_key, api_secret=api_secret)
@@ -0,0 +1,221 @@
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Fall back to plain Python loops so the bot still runs without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def ema_nb(values: np.ndarray, alpha: float, period: int) -> np.ndarray:
+    """Exponential moving average with smoothing factor alpha
+
+    Seeded with the simple average of the first `period` values (the
+    usual TA convention), then advanced with the standard recurrence
+    using alpha = 2 / (period + 1), folded once by the caller.
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    if n < period:
+        for i in range(n):
+            out[i] = np.nan
+        return out
+    seed = 0.0
+    for i in range(period):
+        out[i] = np.nan
+        seed += values[i]
+    out[period - 1] = seed / period
+    for i in range(period, n):
+        out[i] = alpha * values[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def stoch_nb(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+             period: int, k_period: int):
+    """Stochastic oscillator %K and %D lines
+
+    The window extrema come from Lemire's streaming min/max: two index
+    deques (flat arrays with head/tail cursors) amortize to under two
+    comparisons per element instead of rescanning the window per bar.
+    """
+    n = close.shape[0]
+    k = np.empty(n)
+    d = np.empty(n)
+    max_q = np.empty(n, np.int64)
+    min_q = np.empty(n, np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+    for i in range(n):
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+        if max_q[max_head] <= i - period:
+            max_head += 1
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+        if min_q[min_head] <= i - period:
+            min_head += 1
+        if i < period - 1:
+            k[i] = np.nan
+            continue
+        highest_high = high[max_q[max_head]]
+        lowest_low = low[min_q[min_head]]
+        k[i] = 100.0 * (close[i] - lowest_low) / (highest_high - lowest_low)
+    for i in range(n):
+        if i < k_period - 1:
+            d[i] = np.nan
+            continue
+        total = 0.0
+        for j in range(i - k_period + 1, i + 1):
+            total += k[j]
+        d[i] = total / k_period
+    return k, d
+
+
+@njit(cache=True, fastmath=True)
+def atr_nb(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+           period: int) -> np.ndarray:
+    """Average True Range with Wilder smoothing
+
+    Seeded with the simple mean of the first `period` true ranges, then
+    atr = (atr_prev * (period - 1) + tr) / period — the classic Wilder
+    recurrence, which also gives the streaming path an O(1) update.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    if n < period:
+        for i in range(n):
+            out[i] = np.nan
+        return out
+    seed = high[0] - low[0]
+    out[0] = np.nan
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr = max(hl, hc, lc)
+        if i < period - 1:
+            seed += tr
+            out[i] = np.nan
+        elif i == period - 1:
+            out[i] = (seed + tr) / period
+        else:
+            out[i] = (out[i - 1] * (period - 1) + tr) / period
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def fused_indicators_nb(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        alpha_fast: float, fast_period: int,
+                        alpha_slow: float, slow_period: int,
+                        stoch_period: int, atr_period: int,
+                        ema_fast: np.ndarray, ema_slow: np.ndarray,
+                        k: np.ndarray, atr: np.ndarray):
+    """Both EMAs, stochastic %K and Wilder ATR fused into one pass
+
+    A single loop keeps the running EMA/ATR state and the candle being
+    read in registers across all four indicators instead of re-walking
+    the arrays once per indicator. Results are written into the four
+    caller-provided output arrays (each at least len(close) long), so a
+    caller that reuses its buffers pays no allocation per call. The
+    stochastic extrema use the same Lemire index-deque scheme as
+    stoch_nb — amortized O(1) per bar.
+    """
+    n = close.shape[0]
+    fast_seed = 0.0
+    slow_seed = 0.0
+    tr_seed = 0.0
+    max_q = np.empty(n, np.int64)
+    min_q = np.empty(n, np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+    for i in range(n):
+        c = close[i]
+        h = high[i]
+        l = low[i]
+
+        # EMA recurrences with simple-average warm-up seeds
+        if i < fast_period - 1:
+            fast_seed += c
+            ema_fast[i] = np.nan
+        elif i == fast_period - 1:
+            ema_fast[i] = (fast_seed + c) / fast_period
+        else:
+            ema_fast[i] = alpha_fast * c + (1.0 - alpha_fast) * ema_fast[i - 1]
+        if i < slow_period - 1:
+            slow_seed += c
+            ema_slow[i] = np.nan
+        elif i == slow_period - 1:
+            ema_slow[i] = (slow_seed + c) / slow_period
+        else:
+            ema_slow[i] = alpha_slow * c + (1.0 - alpha_slow) * ema_slow[i - 1]
+
+        # Stochastic %K over the trailing window
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= h:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+        if max_q[max_head] <= i - stoch_period:
+            max_head += 1
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= l:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+        if min_q[min_head] <= i - stoch_period:
+            min_head += 1
+        if i < stoch_period - 1:
+            k[i] = np.nan
+        else:
+            highest_high = high[max_q[max_head]]
+            lowest_low = low[min_q[min_head]]
+            k[i] = 100.0 * (c - lowest_low) / (highest_high - lowest_low)
+
+        # Wilder ATR
+        if i == 0:
+            tr = h - l
+        else:
+            tr = max(h - l, abs(h - close[i - 1]), abs(l - close[i - 1]))
+        if i < atr_period - 1:
+            tr_seed += tr
+            atr[i] = np.nan
+        elif i == atr_period - 1:
+            atr[i] = (tr_seed + tr) / atr_period
+        else:
+            atr[i] = (atr[i - 1] * (atr_period - 1) + tr) / atr_period
+    return ema_fast, ema_slow, k, atr
+
+
+def warmup(period: int = 14, k_period: int = 2):
+    """Trigger JIT compilation once so the first tick isn't penalized"""
+    dummy = np.zeros(max(period, k_period) * 2 + 2)
+    scratch = np.empty((4, dummy.shape[0]))
+    ema_nb(dummy, 2.0 / (period + 1.0), period)
+    stoch_nb(dummy, dummy, dummy, period, k_period)
+    atr_nb(dummy, dummy, dummy, period)
+    fused_indicators_nb(dummy, dummy, dummy, 0.5, 3, 0.25, 7, period, period,
+                        scratch[0], scratch[1], scratch[2], scratch[3])
@@ -1,21 +1,65 @@
+import os
 import pandas as pd
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Dict
-import yaml
 import logging
-from datetime import datetime
 from .bybit_client import BybitClient
+from .config_loader import load_config
+from . import indicators_nb
+
+try:
+    # Optional: TA-Lib's C implementations for the batch indicator methods
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+try:
+    # Optional: polars' multi-threaded engine for batch indicator frames
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Cached once; rebuilding the decorative banner per tick is wasted work
+_BANNER = '=' * 50
+
+# Shared pool for the batch entry-point; threads are only spawned on first
+# use, and the NumPy/numba indicator work releases the GIL so symbols
+# genuinely run in parallel
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='batch')
+
+
+class _SymbolAdapter(logging.LoggerAdapter):
+    """Prepends a symbol prefix bound once at construction
+
+    process() only runs for records that pass the level check, so the
+    prefix concatenation replaces a per-call f-string with work done
+    solely on emitted records.
+    """
+
+    def process(self, msg, kwargs):
+        return self.extra['prefix'] + msg, kwargs
+
 class TradingStrategy:
-    def __init__(self, config_path: str, symbol: str):
-        """Initialize the trading strategy with configuration"""
+    def __init__(self, config, symbol: str):
+        """Initialize the trading strategy with configuration
+
+        config is either an already-parsed config dict or a path to the
+        YAML file; parsing once in main() avoids re-reading it per asset.
+        """
         self.symbol = symbol
-        
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        
+        # Per-symbol logger: the "[SYMBOL] " prefix is bound once here
+        # instead of re-formatted into every message
+        self.log = _SymbolAdapter(logger, {'prefix': f"[{symbol}] "})
+
+        if isinstance(config, str):
+            config = load_config(config)
+
         # Find the asset config for this symbol
         self.asset_config = None
         for asset in config['assets']:
@@ -32,6 +76,20 @@ class TradingStrategy:
         self.slow_ema = strategy_config['slow_ema']
         self.stoch_period = strategy_config['stoch_period']
         self.stoch_k_period = strategy_config['stoch_k_period']
+
+        # Opt-in float32 indicator math: halves the bytes the kernels move
+        # through cache, at precision still far beyond crypto tick sizes.
+        # Defaults to float64
+        self._dtype = np.float32 if strategy_config.get('use_float32', False) else np.float64
+
+        # EMA smoothing factors are fixed by the configured spans; fold them
+        # once instead of deriving them on every update
+        self._alpha_fast = 2.0 / (self.fast_ema + 1.0)
+        self._alpha_slow = 2.0 / (self.slow_ema + 1.0)
+
+        # Minimum history needed before signals make sense; computed once
+        # instead of re-deriving it on every tick
+        self._min_bars = max(self.fast_ema, self.slow_ema, self.stoch_period)
         
         # Kelly Criterion parameters
         self.win_rate = 0.6061  # From backtest: 60.61%
@@ -45,17 +103,52 @@ class TradingStrategy:
         
         # Calculate Kelly position size
         self.kelly_percentage = self.calculate_kelly_percentage()
-        logger.info(f"[{symbol}] Kelly Position Size: {self.kelly_percentage:.2f}%")
+        self.log.info("Kelly Position Size: %.2f%%", self.kelly_percentage)
+
+        # Constant per-trade scalars hoisted out of the tick path: the
+        # take-profit distance multiplier and the Kelly dollar budget for
+        # this asset only change when the config does
+        self._tp_mult = self.atr_multiplier * self.risk_reward_ratio
+        self._kelly_notional = (self.account_size * self.asset_allocation
+                                * self.kelly_percentage / 100)
         
-        # Initialize Bybit client
-        self.client = BybitClient(config_path)
+        # Initialize Bybit client with the already-parsed config
+        self.client = BybitClient(config)
         
         # Track current position
         self.current_position = None
+
+        # Streaming indicator state: seeded once from the full history, then
+        # updated in O(1) per closed candle instead of recomputing every series
+        self.atr_period = 14
+        self.volume_period = 20
+        self._reset_stream_state()
+
+        # Seeding only ever needs a bounded trailing window: 4x the slow
+        # EMA span carries >99.9% of the EMA weight, Wilder's 1/period
+        # smoothing needs ~8 periods for the same decay, and the window
+        # indicators need at most their own lengths
+        self._tail = max(4 * self.slow_ema,
+                         8 * self.atr_period,
+                         self.stoch_period + self.stoch_k_period,
+                         self.volume_period) + 2
+
+        # Output buffers for the fused seed kernel, grown on demand and
+        # reused across reseeds so seeding allocates nothing in steady state
+        self._kernel_out = None
+
+        # Batch engine for compute_indicators: polars when installed,
+        # otherwise the pandas/TA-Lib methods
+        self._engine = 'polars' if POLARS_AVAILABLE else 'pandas'
+
+        # Pay the JIT compilation cost up front rather than on the first tick
+        if indicators_nb.NUMBA_AVAILABLE:
+            indicators_nb.warmup(self.stoch_period, self.stoch_k_period)
         
-        logger.info(f"[{symbol}] Strategy initialized with parameters: Fast EMA: {self.fast_ema}, "
-                   f"Slow EMA: {self.slow_ema}, Stoch Period: {self.stoch_period}, "
-                   f"Stoch K: {self.stoch_k_period}, Allocation: {self.asset_allocation*100}%")
+        self.log.info("Strategy initialized with parameters: Fast EMA: %s, "
+                      "Slow EMA: %s, Stoch Period: %s, Stoch K: %s, Allocation: %s%%",
+                      self.fast_ema, self.slow_ema, self.stoch_period,
+                      self.stoch_k_period, self.asset_allocation * 100)
     
     def calculate_kelly_percentage(self) -> float:
         """Calculate Kelly Criterion percentage"""
@@ -66,10 +159,24 @@ class TradingStrategy:
     
     def calculate_ema(self, data: pd.Series, period: int) -> pd.Series:
         """Calculate Exponential Moving Average"""
+        if TALIB_AVAILABLE:
+            values = data.to_numpy(dtype=np.float64)
+            return pd.Series(talib.EMA(values, timeperiod=period), index=data.index)
         return data.ewm(span=period, adjust=False).mean()
-    
+
     def calculate_stochastic(self, high: pd.Series, low: pd.Series, close: pd.Series) -> Tuple[pd.Series, pd.Series]:
         """Calculate Stochastic Oscillator"""
+        if TALIB_AVAILABLE:
+            # STOCHF's fast %K / %D matches this definition exactly
+            k_arr, d_arr = talib.STOCHF(
+                high.to_numpy(dtype=np.float64),
+                low.to_numpy(dtype=np.float64),
+                close.to_numpy(dtype=np.float64),
+                fastk_period=self.stoch_period,
+                fastd_period=self.stoch_k_period,
+                fastd_matype=0
+            )
+            return pd.Series(k_arr, index=close.index), pd.Series(d_arr, index=close.index)
         lowest_low = low.rolling(window=self.stoch_period).min()
         highest_high = high.rolling(window=self.stoch_period).max()
         k_line = 100 * (close - lowest_low) / (highest_high - lowest_low)
@@ -78,108 +185,345 @@ class TradingStrategy:
     
     def calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
         """Calculate Average True Range"""
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        return tr.rolling(window=period).mean()
+        if TALIB_AVAILABLE:
+            # TA-Lib's ATR uses the same Wilder smoothing as the kernels
+            atr_arr = talib.ATR(
+                high.to_numpy(dtype=np.float64),
+                low.to_numpy(dtype=np.float64),
+                close.to_numpy(dtype=np.float64),
+                timeperiod=period
+            )
+            return pd.Series(atr_arr, index=high.index)
+        high_a = high.to_numpy()
+        low_a = low.to_numpy()
+        close_a = close.to_numpy()
+        # Elementwise max over the three true-range candidates on raw arrays —
+        # no temporary 3-column frame just to take a row-wise max
+        tr = high_a - low_a
+        if len(close_a) > 1:
+            prev_close = close_a[:-1]
+            tr[1:] = np.maximum(tr[1:],
+                                np.maximum(np.abs(high_a[1:] - prev_close),
+                                           np.abs(low_a[1:] - prev_close)))
+        # Window mean from a cumulative sum — one pass and one subtraction
+        # instead of pandas' rolling machinery
+        atr = np.full(tr.shape[0], np.nan)
+        if tr.shape[0] >= period:
+            csum = np.cumsum(tr)
+            atr[period - 1] = csum[period - 1] / period
+            atr[period:] = (csum[period:] - csum[:-period]) / period
+        return pd.Series(atr, index=high.index)
     
-    def generate_signals(self, data: pd.DataFrame) -> Dict:
-        """Generate trading signals from market data"""
+    def _reset_stream_state(self):
+        """(Re)initialize every piece of streaming indicator state
+
+        One place owns the full inventory of per-candle state: EMA and ATR
+        scalars, the stochastic window machinery, and the rolling volume
+        sums. Anything the O(1) update path touches is defined here.
+        """
+        self._last_bar_ts = None
+        self._ema_fast_val = None
+        self._ema_slow_val = None
+        self._atr_val = None
+        self._prev_k = np.nan
+        self._curr_k = np.nan
+        # Monotonic deques of (bar index, value): front holds the rolling
+        # window extremum, so each bar costs O(1) amortized instead of a
+        # full min()/max() scan over the window
+        self._bar_i = -1
+        self._high_mono = deque()
+        self._low_mono = deque()
+        self._k_window = deque(maxlen=self.stoch_k_period)
+        self._prev_close = None
+        # Welford-style running mean and M2 over the 20-bar volume window
+        # give the filter's mean/std in O(1) per bar; unlike plain
+        # sum-of-squares this stays numerically stable when volumes are
+        # large relative to their spread
+        self._vol_window = deque(maxlen=self.volume_period)
+        self._vol_mean = 0.0
+        self._vol_m2 = 0.0
+
+    def compute_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Batch indicator columns over a full OHLCV history
+
+        For research and multi-timeframe work on longer windows — the live
+        tick path uses the streaming updaters instead. Runs on polars'
+        multi-threaded engine when the package is installed, otherwise on
+        the pandas/TA-Lib methods. Returns a frame with ema_fast,
+        ema_slow, stoch_k, stoch_d, atr, volume_sma and volume_std
+        alongside the input columns.
+        """
+        if self._engine == 'polars':
+            return self._indicators_polars(data)
+        out = data.copy()
+        out['ema_fast'] = self.calculate_ema(data['close'], self.fast_ema)
+        out['ema_slow'] = self.calculate_ema(data['close'], self.slow_ema)
+        stoch_k, stoch_d = self.calculate_stochastic(
+            data['high'], data['low'], data['close'])
+        out['stoch_k'] = stoch_k
+        out['stoch_d'] = stoch_d
+        out['atr'] = self.calculate_atr(
+            data['high'], data['low'], data['close'], self.atr_period)
+        out['volume_sma'] = data['volume'].rolling(self.volume_period).mean()
+        out['volume_std'] = data['volume'].rolling(self.volume_period).std()
+        return out
+
+    def _indicators_polars(self, data: pd.DataFrame) -> pd.DataFrame:
+        """polars variant of compute_indicators: one fused expression chain"""
+        frame = pl.DataFrame({
+            column: data[column].to_numpy()
+            for column in ('open', 'high', 'low', 'close', 'volume')
+            if column in data.columns
+        })
+        lowest_low = pl.col('low').rolling_min(self.stoch_period)
+        highest_high = pl.col('high').rolling_max(self.stoch_period)
+        prev_close = pl.col('close').shift(1)
+        true_range = pl.max_horizontal(
+            pl.col('high') - pl.col('low'),
+            (pl.col('high') - prev_close).abs(),
+            (pl.col('low') - prev_close).abs()
+        )
+        frame = frame.with_columns(
+            pl.col('close').ewm_mean(alpha=self._alpha_fast, adjust=False)
+              .alias('ema_fast'),
+            pl.col('close').ewm_mean(alpha=self._alpha_slow, adjust=False)
+              .alias('ema_slow'),
+            (100 * (pl.col('close') - lowest_low)
+             / (highest_high - lowest_low)).alias('stoch_k'),
+            pl.col('volume').rolling_mean(self.volume_period).alias('volume_sma'),
+            pl.col('volume').rolling_std(self.volume_period).alias('volume_std'),
+            true_range.alias('_tr')
+        ).with_columns(
+            pl.col('stoch_k').rolling_mean(self.stoch_k_period).alias('stoch_d'),
+            pl.col('_tr').rolling_mean(self.atr_period).alias('atr')
+        ).drop('_tr')
+        result = frame.to_pandas()
+        result.index = data.index
+        return result
+
+    def _seed_indicators(self, high: np.ndarray, low: np.ndarray,
+                         close: np.ndarray, volume: np.ndarray):
+        """Recompute indicators over the full history and capture streaming state"""
+        if close.shape[0] > self._tail:
+            # The answer depends only on the trailing window, so don't walk
+            # thousands of historical bars to get it
+            high = high[-self._tail:]
+            low = low[-self._tail:]
+            close = close[-self._tail:]
+            volume = volume[-self._tail:]
+
+        n = close.shape[0]
+        if self._kernel_out is None or self._kernel_out.shape[1] < n:
+            self._kernel_out = np.empty((4, n))
+        out = self._kernel_out
+
+        ema_fast, ema_slow, stoch_k, atr = indicators_nb.fused_indicators_nb(
+            high, low, close,
+            self._alpha_fast, self.fast_ema,
+            self._alpha_slow, self.slow_ema,
+            self.stoch_period, self.atr_period,
+            out[0, :n], out[1, :n], out[2, :n], out[3, :n]
+        )
+
+        self._ema_fast_val = ema_fast[-1]
+        self._ema_slow_val = ema_slow[-1]
+        self._atr_val = atr[-1]
+        self._prev_k = stoch_k[-2]
+        self._curr_k = stoch_k[-1]
+
+        self._bar_i = -1
+        self._high_mono.clear()
+        self._low_mono.clear()
+        for h, l in zip(high[-self.stoch_period:], low[-self.stoch_period:]):
+            self._bar_i += 1
+            self._push_extrema(self._bar_i, h, l)
+        self._k_window = deque(stoch_k[-self.stoch_k_period:].tolist(),
+                               maxlen=self.stoch_k_period)
+        self._prev_close = close[-1]
+
+        volume_tail = volume[-self.volume_period:]
+        self._vol_window = deque(volume_tail.tolist(), maxlen=self.volume_period)
+        self._vol_mean = float(volume_tail.mean())
+        self._vol_m2 = float(((volume_tail - self._vol_mean) ** 2).sum())
+
+        self.log.info("Streaming indicator state seeded from %d candles",
+                      len(close))
+
+    def _push_extrema(self, i: int, high: float, low: float):
+        """Advance the monotonic window extrema deques by one bar"""
+        high_mono = self._high_mono
+        while high_mono and high_mono[-1][1] <= high:
+            high_mono.pop()
+        high_mono.append((i, high))
+        while high_mono[0][0] <= i - self.stoch_period:
+            high_mono.popleft()
+
+        low_mono = self._low_mono
+        while low_mono and low_mono[-1][1] >= low:
+            low_mono.pop()
+        low_mono.append((i, low))
+        while low_mono[0][0] <= i - self.stoch_period:
+            low_mono.popleft()
+
+    def _update_volume(self, volume: float):
+        """O(1) sliding Welford update of the window mean and M2
+
+        Growing window: the classic Welford add. Full window: West's
+        replace step, which swaps the evicted bar for the new one in one
+        pass without the catastrophic cancellation a sum-of-squares
+        difference can suffer.
+        """
+        window = self._vol_window
+        if len(window) == window.maxlen:
+            evicted = window[0]
+            old_mean = self._vol_mean
+            self._vol_mean = old_mean + (volume - evicted) / window.maxlen
+            self._vol_m2 += ((volume - evicted)
+                             * (volume - self._vol_mean + evicted - old_mean))
+        else:
+            delta = volume - self._vol_mean
+            self._vol_mean += delta / (len(window) + 1)
+            self._vol_m2 += delta * (volume - self._vol_mean)
+        window.append(volume)
+
+    def _volume_stats(self) -> Tuple[float, float]:
+        """Mean and sample std of the volume window, NaN until it fills"""
+        n = len(self._vol_window)
+        if n < self.volume_period:
+            return float('nan'), float('nan')
+        return self._vol_mean, np.sqrt(max(self._vol_m2 / (n - 1), 0.0))
+
+    def _update_indicators(self, high: float, low: float, close: float):
+        """O(1) streaming update for one newly closed candle"""
+        alpha_fast = self._alpha_fast
+        alpha_slow = self._alpha_slow
+        self._ema_fast_val = alpha_fast * close + (1.0 - alpha_fast) * self._ema_fast_val
+        self._ema_slow_val = alpha_slow * close + (1.0 - alpha_slow) * self._ema_slow_val
+
+        self._bar_i += 1
+        self._push_extrema(self._bar_i, high, low)
+        lowest_low = self._low_mono[0][1]
+        highest_high = self._high_mono[0][1]
+        k = 100.0 * (close - lowest_low) / (highest_high - lowest_low)
+        self._prev_k = self._curr_k
+        self._curr_k = k
+        self._k_window.append(k)
+
+        # Wilder recurrence: one multiply-add instead of a window mean
+        tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        period = self.atr_period
+        self._atr_val = (self._atr_val * (period - 1) + tr) / period
+        self._prev_close = close
+
+    def _advance_indicators(self, index: pd.Index, high: np.ndarray,
+                            low: np.ndarray, close: np.ndarray,
+                            volume: np.ndarray):
+        """Bring the streaming state up to date with the latest candle"""
+        ts = index[-1]
+        if self._last_bar_ts is not None and ts == self._last_bar_ts:
+            # Same bar re-analyzed; state is already current
+            return
+        if (self._last_bar_ts is not None and len(index) >= 2
+                and index[-2] == self._last_bar_ts):
+            self._update_indicators(high[-1], low[-1], close[-1])
+            self._update_volume(volume[-1])
+        else:
+            # Cold start or a gap in the stream: reseed from the full history
+            self._seed_indicators(high, low, close, volume)
+        self._last_bar_ts = ts
+
+    def generate_signals(self, high: np.ndarray, low: np.ndarray,
+                         close: np.ndarray, volume: np.ndarray,
+                         index: pd.Index) -> Dict:
+        """Generate trading signals from raw OHLCV column arrays
+
+        The caller extracts each column exactly once; everything in here
+        works on contiguous float64 arrays and plain scalar reads — no
+        DataFrame copies, column assignment, or .iloc row objects.
+        """
         try:
-            df = data.copy()
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            logger.info(f"\n{'='*50}\n[{self.symbol}] Analyzing market at {current_time}\n{'='*50}")
-            
-            # Calculate indicators
-            df['ema_fast'] = self.calculate_ema(df['close'], self.fast_ema)
-            df['ema_slow'] = self.calculate_ema(df['close'], self.slow_ema)
-            df['stoch_k'], df['stoch_d'] = self.calculate_stochastic(
-                df['high'], df['low'], df['close']
-            )
-            df['atr'] = self.calculate_atr(df['high'], df['low'], df['close'])
-            
-            # Calculate volume metrics
-            df['volume_sma'] = df['volume'].rolling(window=20).mean()
-            df['volume_std'] = df['volume'].rolling(window=20).std()
-            volume_filter = df['volume'] > (df['volume_sma'] + df['volume_std'])
-            
-            # Get latest data point
-            current = df.iloc[-1]
-            previous = df.iloc[-2]
-            
-            # Log market conditions
-            logger.info(f"[{self.symbol}] Market Conditions:")
-            logger.info(f"[{self.symbol}] Current Price: ${current['close']:,.2f}")
-            logger.info(f"[{self.symbol}] EMAs - Fast: ${current['ema_fast']:,.2f}, Slow: ${current['ema_slow']:,.2f}")
-            logger.info(f"[{self.symbol}] Stochastic - Previous: {previous['stoch_k']:.1f}, Current: {current['stoch_k']:.1f}")
-            
-            # Log volume conditions
-            logger.info(f"[{self.symbol}] Volume Analysis:")
-            logger.info(f"[{self.symbol}] Current Volume: {current['volume']:,.2f}")
-            logger.info(f"[{self.symbol}] 20-period Average Volume: {current['volume_sma']:,.2f}")
-            logger.info(f"[{self.symbol}] Volume Standard Deviation: {current['volume_std']:,.2f}")
-            logger.info(f"[{self.symbol}] Required Volume for Trade: {(current['volume_sma'] + current['volume_std']):,.2f}")
-            
-            if not volume_filter.iloc[-1]:
-                logger.info(f"[{self.symbol}] DECISION: No trade - Volume too low")
+            # One level check up front; with INFO disabled in production
+            # every log call (and its argument evaluation) below is skipped
+            _info = logger.isEnabledFor(logging.INFO)
+
+            if _info:
+                # %(asctime)s on the handler already stamps the record
+                self.log.info("Analyzing market\n%s", _BANNER)
+
+            # Bring the streaming indicator state up to date (O(1) per candle)
+            self._advance_indicators(index, high, low, close, volume)
+
+            # Volume gate first: it rejects most candles, and its 20-bar
+            # mean/std now come from running sums kept by the streaming
+            # update — no tail slice or per-tick reduction
+            current_volume = self._vol_window[-1]
+            volume_sma, volume_std = self._volume_stats()
+
+            # Log volume conditions in one deferred-format record
+            if _info:
+                self.log.info("Volume Analysis: Current: %.2f, 20-period Average: %.2f, "
+                              "Std Dev: %.2f, Required for Trade: %.2f",
+                              current_volume, volume_sma, volume_std,
+                              volume_sma + volume_std)
+
+            if not current_volume > (volume_sma + volume_std):
+                if _info:
+                    self.log.info("DECISION: No trade - Volume too low")
                 return {'signal': 0}
-            
-            current_price = current['close']
-            current_atr = current['atr']
-            
-            # Check trend direction
-            trend = "BULLISH" if current_price > current['ema_slow'] else "BEARISH"
-            logger.info(f"[{self.symbol}] Overall Trend: {trend}")
-            
-            # Buy signal conditions
-            buy_conditions = (
-                current_price > current['ema_fast'] and
-                current_price > current['ema_slow'] and
-                previous['stoch_k'] < 20 and current['stoch_k'] > 20
+
+            current_price = close[-1]
+
+            current_atr = self._atr_val
+
+            # Log market conditions in one deferred-format record
+            if _info:
+                trend = "BULLISH" if current_price > self._ema_slow_val else "BEARISH"
+                self.log.info("Market Conditions: Price: $%.2f, EMA Fast: $%.2f, "
+                              "EMA Slow: $%.2f, Stoch Previous: %.1f, Stoch Current: %.1f, "
+                              "Trend: %s",
+                              current_price, self._ema_fast_val,
+                              self._ema_slow_val, self._prev_k, self._curr_k, trend)
+
+            # Evaluate all four legs of each condition and combine them with
+            # a bitwise AND — no short-circuit branching on the crossover legs
+            buy_conditions = bool(
+                int(current_price > self._ema_fast_val)
+                & int(current_price > self._ema_slow_val)
+                & int(self._prev_k < 20)
+                & int(self._curr_k > 20)
             )
-            
-            # Sell signal conditions
-            sell_conditions = (
-                current_price < current['ema_fast'] and
-                current_price < current['ema_slow'] and
-                previous['stoch_k'] > 80 and current['stoch_k'] < 80
+
+            sell_conditions = bool(
+                int(current_price < self._ema_fast_val)
+                & int(current_price < self._ema_slow_val)
+                & int(self._prev_k > 80)
+                & int(self._curr_k < 80)
             )
             
-            signal = 0
-            stop_loss = None
-            take_profit = None
-            
-            # Calculate position size based on Kelly and allocation
-            asset_account_size = self.account_size * self.asset_allocation
-            position_size = (asset_account_size * self.kelly_percentage / 100) / current_price
-            
-            if buy_conditions:
-                signal = 1
-                stop_loss = current_price - (current_atr * self.atr_multiplier)
-                take_profit = current_price + (current_atr * self.atr_multiplier * self.risk_reward_ratio)
-                
-                logger.info(f"[{self.symbol}] DECISION: BUY SIGNAL GENERATED")
-                logger.info(f"[{self.symbol}] Entry Price: ${current_price:,.2f}")
-                logger.info(f"[{self.symbol}] Stop Loss: ${stop_loss:,.2f} (${current_price - stop_loss:,.2f} risk)")
-                logger.info(f"[{self.symbol}] Take Profit: ${take_profit:,.2f} (${take_profit - current_price:,.2f} reward)")
-                logger.info(f"[{self.symbol}] Position Size: {position_size:.4f} (${(position_size * current_price):,.2f})")
-            
-            elif sell_conditions:
-                signal = -1
-                stop_loss = current_price + (current_atr * self.atr_multiplier)
-                take_profit = current_price - (current_atr * self.atr_multiplier * self.risk_reward_ratio)
-                
-                logger.info(f"[{self.symbol}] DECISION: SELL SIGNAL GENERATED")
-                logger.info(f"[{self.symbol}] Entry Price: ${current_price:,.2f}")
-                logger.info(f"[{self.symbol}] Stop Loss: ${stop_loss:,.2f} (${stop_loss - current_price:,.2f} risk)")
-                logger.info(f"[{self.symbol}] Take Profit: ${take_profit:,.2f} (${current_price - take_profit:,.2f} reward)")
-                logger.info(f"[{self.symbol}] Position Size: {position_size:.4f} (${(position_size * current_price):,.2f})")
-            
-            else:
-                logger.info(f"[{self.symbol}] DECISION: No trade - Conditions not met")
-                logger.info(f"[{self.symbol}] Buy Conditions Met: {buy_conditions}")
-                logger.info(f"[{self.symbol}] Sell Conditions Met: {sell_conditions}")
+            # signal in {-1, 0, 1}; its sign places the stop below/above
+            # price and flips the target with it, so both directions fall
+            # out of one straight-line expression — no mirrored branches
+            signal = int(buy_conditions) - int(sell_conditions)
+            stop_loss = current_price - signal * current_atr * self.atr_multiplier
+            take_profit = current_price + signal * current_atr * self._tp_mult
+
+            # Position size: precomputed Kelly dollar budget at this price
+            position_size = self._kelly_notional / current_price
+
+            if _info:
+                if signal != 0:
+                    risk = abs(current_price - stop_loss)
+                    self.log.info("DECISION: %s SIGNAL GENERATED - Entry: $%.2f, "
+                                  "Stop Loss: $%.2f ($%.2f risk), Take Profit: $%.2f "
+                                  "($%.2f reward), Size: %.4f ($%.2f)",
+                                  "BUY" if signal == 1 else "SELL",
+                                  current_price, stop_loss, risk, take_profit,
+                                  risk * self.risk_reward_ratio, position_size,
+                                  position_size * current_price)
+                else:
+                    self.log.info("DECISION: No trade - Conditions not met "
+                                  "(buy: %s, sell: %s)",
+                                  buy_conditions, sell_conditions)
             
             return {
                 'signal': signal,
@@ -190,20 +534,138 @@ class TradingStrategy:
             }
             
         except Exception as e:
-            logger.error(f"[{self.symbol}] Error generating signals: {e}")
+            self.log.error("Error generating signals: %s", e)
             return {'signal': 0}
     
+    def generate_signals_vectorized(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Signals for every bar of a history in one vectorized pass
+
+        Backtesting helper: the live path decides one bar at a time, but a
+        backtest wants the whole decision series. Runs the fused kernel
+        once, builds the entry conditions as boolean masks, and derives
+        the levels with the same branchless arithmetic as the tick path.
+        Returns arrays for signal (-1/0/1), stop_loss, take_profit and
+        position_size, aligned with the input rows.
+        """
+        high = data['high'].to_numpy(dtype=self._dtype)
+        low = data['low'].to_numpy(dtype=self._dtype)
+        close = data['close'].to_numpy(dtype=self._dtype)
+        volume = data['volume'].to_numpy(dtype=self._dtype)
+        n = close.shape[0]
+
+        out = np.empty((4, n))
+        ema_fast, ema_slow, stoch_k, atr = indicators_nb.fused_indicators_nb(
+            high, low, close,
+            self._alpha_fast, self.fast_ema,
+            self._alpha_slow, self.slow_ema,
+            self.stoch_period, self.atr_period,
+            out[0], out[1], out[2], out[3]
+        )
+        prev_k = np.empty(n)
+        prev_k[0] = np.nan
+        prev_k[1:] = stoch_k[:-1]
+
+        # 20-bar volume mean and sample std from cumulative sums
+        window = self.volume_period
+        volume_sma = np.full(n, np.nan)
+        volume_std = np.full(n, np.nan)
+        if n >= window:
+            csum = np.cumsum(volume)
+            csumsq = np.cumsum(volume * volume)
+            sums = csum[window - 1:].copy()
+            sums[1:] -= csum[:-window]
+            sumsqs = csumsq[window - 1:].copy()
+            sumsqs[1:] -= csumsq[:-window]
+            volume_sma[window - 1:] = sums / window
+            variance = (sumsqs - sums * sums / window) / (window - 1)
+            volume_std[window - 1:] = np.sqrt(np.maximum(variance, 0.0))
+        volume_ok = volume > volume_sma + volume_std
+
+        buy_mask = ((close > ema_fast) & (close > ema_slow)
+                    & (prev_k < 20) & (stoch_k > 20) & volume_ok)
+        sell_mask = ((close < ema_fast) & (close < ema_slow)
+                     & (prev_k > 80) & (stoch_k < 80) & volume_ok)
+
+        signal = buy_mask.astype(np.int64) - sell_mask.astype(np.int64)
+        stop_loss = close - signal * atr * self.atr_multiplier
+        take_profit = close + signal * atr * self._tp_mult
+        position_size = np.where(signal != 0, self._kelly_notional / close, 0.0)
+
+        return {
+            'signal': signal,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'position_size': position_size
+        }
+
+    @staticmethod
+    def batch_on_new_data(strategies: Dict[str, 'TradingStrategy'],
+                          data_map: Dict[str, pd.DataFrame]):
+        """Run on_new_data for several symbols concurrently
+
+        Backtesting and polling callers that hold one strategy per symbol
+        can fan the per-symbol work out over the shared pool instead of
+        looping sequentially. The live WebSocket path already dispatches
+        through its own executor and does not need this.
+        """
+        futures = [
+            _POOL.submit(strategies[symbol].on_new_data, df)
+            for symbol, df in data_map.items()
+            if symbol in strategies
+        ]
+        for future in futures:
+            future.result()
+
+    def _manage_open_position(self, df: pd.DataFrame):
+        """Check the open position against its stop/TP levels
+
+        The exchange holds the actual stop-loss and take-profit orders, so
+        this only watches the latest close to notice when one of them must
+        have filled and clears the local position state — no indicator
+        recomputation while a position is open.
+        """
+        position = self.current_position
+        last_close = df['close'].iat[-1]
+
+        if position['side'] == "Buy":
+            stop_hit = last_close <= position['stop_loss']
+            target_hit = last_close >= position['take_profit']
+        else:
+            stop_hit = last_close >= position['stop_loss']
+            target_hit = last_close <= position['take_profit']
+
+        if stop_hit or target_hit:
+            reason = "stop loss" if stop_hit else "take profit"
+            self.log.info("POSITION CLOSED: %s %s hit at $%.2f (entry $%.2f)",
+                          position['side'], reason,
+                          last_close, position['entry_price'])
+            self.current_position = None
+
     def on_new_data(self, df: pd.DataFrame):
         """Handle new market data updates"""
         try:
+            # While a position is open we never enter another one, so skip
+            # the whole signal pipeline and only do the cheap stop/TP check;
+            # the streaming indicator state reseeds itself from history once
+            # entries are possible again
+            if self.current_position is not None:
+                return self._manage_open_position(df)
+
             # Check if we have enough data
-            if len(df) < max(self.fast_ema, self.slow_ema, self.stoch_period):
-                logger.info(f"[{self.symbol}] Not enough data yet. Have {len(df)} candles, need at least "
-                           f"{max(self.fast_ema, self.slow_ema, self.stoch_period)}")
+            if len(df) < self._min_bars:
+                self.log.info("Not enough data yet. Have %d candles, need at least %d",
+                              len(df), self._min_bars)
                 return
             
-            # Generate signals from new data
-            signal_data = self.generate_signals(df)
+            # Pull each OHLCV column out of the frame exactly once as a
+            # contiguous float64 array; the signal path is pandas-free
+            signal_data = self.generate_signals(
+                df['high'].to_numpy(dtype=self._dtype),
+                df['low'].to_numpy(dtype=self._dtype),
+                df['close'].to_numpy(dtype=self._dtype),
+                df['volume'].to_numpy(dtype=self._dtype),
+                df.index
+            )
             
             # Check if we should enter a new position
             if signal_data['signal'] != 0 and self.current_position is None:
@@ -227,7 +689,8 @@ class TradingStrategy:
                         'take_profit': signal_data['take_profit'],
                         'size': signal_data['position_size']
                     }
-                    logger.info(f"[{self.symbol}] ORDER EXECUTED: Entered {side} position at ${signal_data['current_price']:,.2f}")
+                    self.log.info("ORDER EXECUTED: Entered %s position at $%.2f",
+                                  side, signal_data['current_price'])
         
         except Exception as e:
-            logger.error(f"[{self.symbol}] Error handling new data: {e}")
+            self.log.error("Error handling new data: %s", e)